@@ -2,10 +2,13 @@ import unittest
 import os
 import json
 import traceback
+import pytest
 from click.testing import CliRunner
 from unfurl.__main__ import cli, _latestJobs
 from unfurl.configurator import Configurator, TaskView
 from unfurl.plan import DeployPlan
+from unfurl.util import UnfurlError
+from unfurl.yamlmanifest import YamlManifest
 from .utils import init_project, run_job_cmd
 
 
@@ -473,3 +476,44 @@ def test_topology_input_change():
         assert summary["job"]["skipped"] == 1
         assert summary["job"]["total"] == 1
         assert summary["outputs"]["test_output"] == input_value
+
+
+change_log_manifest = """
+  apiVersion: unfurl/v1alpha1
+  kind: Ensemble
+  jobsLog: jobs.tsv
+  spec:
+    service_template:
+      topology_template:
+        node_templates:
+          node1:
+            type: tosca.nodes.Root
+"""
+
+
+def test_deferred_change_log(tmp_path):
+    path = tmp_path / "ensemble.yaml"
+    path.write_text(change_log_manifest)
+    change_log = tmp_path / "jobs.tsv"
+    change_log.write_text(
+        "# comment\n"
+        "A01110000000\tstatus=ok\tstartCommit=\n"
+        # only "\n" separates records, not other line boundaries like form feed
+        "A01110000001\tstatus=ok\ttarget=node1\toperation=configure"
+        "\tsummary=form\x0cfeed\n"
+    )
+    manifest = YamlManifest(path=str(path))
+
+    # a record appended after the ensemble was loaded isn't included
+    with open(change_log, "a") as f:
+        f.write("A01120000001\tstatus=ok\ttarget=node1\toperation=configure\n")
+    assert manifest.changeSets
+    assert list(manifest.changeSets) == ["A01110000001"]
+    last = manifest.find_last_operation("node1", "configure")
+    assert last and last.changeId == "A01110000001"
+
+    # the change log is read lazily so errors surface on first access
+    manifest = YamlManifest(path=str(path))
+    os.remove(change_log)
+    with pytest.raises(UnfurlError, match="jobs.tsv"):
+        manifest.changeSets
@@ -635,6 +635,16 @@ def test_bad_field():
         yaml.dump(yaml_dict, sys.stdout)
 
 
+def test_type_info_union_order():
+    from typing import List, Union
+    from tosca._tosca import pytype_to_tosca_type
+
+    assert pytype_to_tosca_type(Union[int, str]).types == (int, str)
+    assert pytype_to_tosca_type(Union[str, int]).types == (str, int)
+    assert pytype_to_tosca_type(List[Union[int, str]]).types == (int, str)
+    assert pytype_to_tosca_type(List[Union[str, int]]).types == (str, int)
+
+
 def test_class_init() -> None:
     class Example(tosca.nodes.Root):
         shellScript: tosca.artifacts.Root = tosca.artifacts.Root(file="example.sh")
@@ -1225,6 +1235,19 @@ node._name = "test"
         assert _to_yaml(src, True)
 
 
+def test_builtin_types_registered_in_safe_mode():
+    # use a fresh interpreter so the result doesn't depend on what earlier tests imported
+    src = """
+from tosca.python2yaml import python_src_to_yaml_obj
+python_src_to_yaml_obj("import tosca\\nroot = tosca.nodes.Root", {}, safe_mode=True)
+from tosca import ToscaType, nodes
+assert ToscaType._all_types.get("tosca.nodes.Root") is nodes.Root
+"""
+    import subprocess
+
+    subprocess.run([sys.executable, "-c", src], check=True)
+
+
 def test_write_policy():
     test_path = os.path.join(os.getenv("UNFURL_TMPDIR"), "test_generated.txt")
     src = "import unfurl\n"
@@ -1245,6 +1268,9 @@ def test_write_policy():
             "ignore", test_path, "# ignore\nimport tosca\n"
         )
         assert can_write, unchanged == (True, False)
+        # an extra line is a change
+        assert not tosca.WritePolicy.auto.has_contents_unchanged(src + "x = 1\n", src)
+        assert tosca.WritePolicy.auto.has_contents_unchanged("\n" + src, src + "# c\n")
         # mark the output file as modified after the time recorded in the comment
         os.utime(test_path, (time.time() + 5, time.time() + 5))
         # it's changed, so don't overwrite it
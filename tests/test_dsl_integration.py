@@ -70,8 +70,16 @@ def test_options():
         tosca.Attribute(options=expr.tfvar)
     with pytest.raises(ValueError):
         tosca.Property(options=expr.tfoutput)
-    field = tosca.Property(options=expr.tfvar | MyOption("foo"))
-    assert field.metadata == dict(tfvar=True, my_option="foo")
+    field = tosca.Property(options=expr.tfvar | MyOption("foo") | dict(bar=1))
+    assert field.metadata == dict(tfvar=True, my_option="foo", bar=1)
+    # a dict on the left is applied first so the Options on the right take precedence
+    field = tosca.Property(options=dict(tfvar="x", bar=1) | expr.tfvar)
+    assert field.metadata == dict(tfvar=True, bar=1)
+    with pytest.raises(ValueError):
+        tosca.Attribute(options=dict(bar=1) | expr.tfvar)
+    # merging doesn't modify the original options
+    p = tosca.Property(options=expr.tfvar)
+    assert p.metadata == dict(tfvar=True)
 
 
 @pytest.mark.parametrize(
@@ -26,8 +26,8 @@ class EvalTest(unittest.TestCase):
         cm.insert(1, "a", 1, comment="a comment")
         self.assertEqual(cm, {"a": 1, "b": 2})
 
-    def _getTestResource(self, more=None, parent=None):
-        resourceDef = {
+    def _getTestResourceDef(self):
+        return {
             "name": "test",
             "a": {"ref": "name"},
             "b": [1, 2, 3],
@@ -53,13 +53,19 @@ class EvalTest(unittest.TestCase):
             "empty_list": [],
             "ports": ["80:81"]
         }
+
+    def _getTestResource(self, more=None, parent=None):
+        resourceDef = self._getTestResourceDef()
         if more:
             resourceDef.update(more)
-        resource = NodeInstance("test", resourceDef, parent)
-        assert resource.attributes["x"] == resourceDef["x"]
+        return NodeInstance("test", resourceDef, parent)
+
+    def test_test_resource(self):
+        # sanity check the fixture once instead of on every _getTestResource() call
+        resource = self._getTestResource()
+        assert resource.attributes["x"] == self._getTestResourceDef()["x"]
         assert resource.attributes["a"] == "test"
         assert resource.attributes["s"] is resource
-        return resource
 
     def test_refs(self):
         assert Ref.is_ref({"ref": "::name"})
@@ -124,23 +130,25 @@ class EvalTest(unittest.TestCase):
             # [{"q": "{{ foo }}"}, ["{{ foo }}"]]
             # XXX test nested ['.[k[d=3]=4]']
         ]:
-            ref = Ref(exp)
-            # print ('eval', ref.source, ref)
-            result = ref.resolve(RefContext(resource, trace=0))
-            assert all(not isinstance(i, Result) for i in result)
-            if isinstance(expected, set):
-                # for results where order isn't guaranteed in python2.7
-                self.assertEqual(
-                    set(result),
-                    expected,
-                    "expr was: " + ref.source,
-                )
-            else:
-                self.assertEqual(
-                    result,
-                    expected,
-                    "expr was: " + ref.source,
-                )
+            # report each failing expression instead of stopping at the first one
+            with self.subTest(expr=exp):
+                ref = Ref(exp)
+                # print ('eval', ref.source, ref)
+                result = ref.resolve(RefContext(resource, trace=0))
+                assert all(not isinstance(i, Result) for i in result)
+                if isinstance(expected, set):
+                    # for results where order isn't guaranteed in python2.7
+                    self.assertEqual(
+                        set(result),
+                        expected,
+                        "expr was: " + ref.source,
+                    )
+                else:
+                    self.assertEqual(
+                        result,
+                        expected,
+                        "expr was: " + ref.source,
+                    )
 
     def test_last_resource(self):
         parent = NodeInstance("parent")
@@ -1,10 +1,9 @@
 import os
 import os.path
-import sys
 import threading
 import unittest
 from functools import partial
-import shutil
+from http.server import HTTPServer, SimpleHTTPRequestHandler
 import urllib.request
 from click.testing import CliRunner
 
@@ -16,32 +15,33 @@ from .utils import init_project
 # http://localhost:8000/fixtures/helmrepo
 @unittest.skipIf("helm" in os.getenv("UNFURL_TEST_SKIP", ""), "UNFURL_TEST_SKIP set")
 class HelmTest(unittest.TestCase):
-    def setUp(self):
-        self.maxDiff = None
-        path = os.path.join(
-            os.path.dirname(__file__), "examples", "helm-simple-ensemble.yaml"
-        )
-        with open(path) as f:
-            self.manifest = f.read()
-
+    @classmethod
+    def setUpClass(cls):
+        # share one http server across the tests in this class
         server_address = ("", 8010)
         directory = os.path.dirname(__file__)
+        handler = partial(SimpleHTTPRequestHandler, directory=directory)
         try:
-            from http.server import HTTPServer, SimpleHTTPRequestHandler
-
-            handler = partial(SimpleHTTPRequestHandler, directory=directory)
-            self.httpd = HTTPServer(server_address, handler)
-        except:  # address might still be in use
-            self.httpd = None
-            return
+            cls.httpd = HTTPServer(server_address, handler)
+        except OSError as e:  # address might still be in use
+            raise unittest.SkipTest(f"port 8010 in use: {e}")
 
-        t = threading.Thread(name="http_thread", target=self.httpd.serve_forever)
+        t = threading.Thread(name="http_thread", target=cls.httpd.serve_forever)
         t.daemon = True
         t.start()
 
-    def tearDown(self):
-        if self.httpd:
-            self.httpd.socket.close()
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+        cls.httpd.socket.close()
+
+    def setUp(self):
+        self.maxDiff = None
+        path = os.path.join(
+            os.path.dirname(__file__), "examples", "helm-simple-ensemble.yaml"
+        )
+        with open(path) as f:
+            self.manifest = f.read()
 
     def test_deploy(self):
         # make sure this works
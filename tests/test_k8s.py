@@ -6,6 +6,7 @@ import unittest
 import warnings
 import json
 import subprocess
+import tempfile
 from shutil import which
 import pytest
 import time
@@ -119,19 +120,28 @@ def test_namespace_on_connection():
     assert config_map_instance.query(dict(eval={"is_function_defined": "kubernetes_current_namespace"}))
     assert TEST_NS == config_map_instance.query(dict(eval=dict(kubernetes_current_namespace=None)))
 
+# share kubectl's discovery cache across the many kubectl invocations below
+_kubectl_cache_args = [
+    "--cache-dir",
+    os.path.join(tempfile.gettempdir(), "unfurl-test-kubecache"),
+]
+
+
 def _get_resources(task):
     # verify resource start (and test get_kubectl_args)
     args = get_kubectl_args(task.inputs.context)
     assert "-n" in args, args
     assert "--insecure-skip-tls-verify" not in args
-    cmd = ["kubectl"] + args + "get all -o json".split()
-    output = subprocess.run(cmd, capture_output=True).stdout
+    cmd = ["kubectl"] + args + _kubectl_cache_args + "get all -o json".split()
+    # json.loads() accepts the raw bytes, no need to decode
+    # and let stderr through so kubectl errors show up in the test output
+    output = subprocess.run(cmd, stdout=subprocess.PIPE).stdout
     return json.loads(output)
 
 def _get_pod_logs(task, name):
     # verify resource start (and test get_kubectl_args)
     args = get_kubectl_args(task.inputs.context)
-    cmd = ["kubectl"] + args + ["logs", name, "--tail", "15"]
+    cmd = ["kubectl"] + args + _kubectl_cache_args + ["logs", name, "--tail", "15"]
     proc = subprocess.run(cmd, capture_output=True)
     return proc.stdout, proc.stderr
 
@@ -179,9 +189,10 @@ def test_kompose():
                     logs, stderr = _get_pod_logs(task, pod_name)
                     count = 0
                     while not _pod_log_test(logs):
-                        time.sleep(5)
+                        # back off so we don't wait long when the logs are ready quickly
+                        time.sleep(min(0.25 * 2**count, 5))
                         logs, stderr = _get_pod_logs(task, pod_name)
-                        if count > 5:
+                        if count > 10:  # about the same total wait as before
                             assert False, f"timeout trying waiting read logs for {pod_name}, got: {logs} {stderr}"
                         count += 1
 
@@ -14,6 +14,9 @@ from unfurl.util import sensitive_str
 from unfurl import logs
 from ruamel.yaml.comments import CommentedMap
 
+# log file format (it should differ from the console log)
+_job_file_log_format = re.compile(r"\[.+?\] unfurl:INFO: starting deploy job for .*")
+
 
 def test_format_of_job_file_log():
     tmplogfile = logs.get_tmplog_path()
@@ -23,21 +26,15 @@ def test_format_of_job_file_log():
 
     with open(tmplogfile) as f:
         first_line = f.readline()
-        # check format - it should differ from console log
-        expected_format = r"\[.+\] unfurl:INFO: starting deploy job for .*"
-        assert re.match(expected_format, first_line)
+        assert _job_file_log_format.match(first_line), first_line
     os.unlink(tmplogfile)
 
 
 class TestLogLevelDetection:
-    def setup_method(self):
-        self.old_env_level = os.environ.get("UNFURL_LOGGING")
-        if self.old_env_level:
-            del os.environ["UNFURL_LOGGING"]
-
-    def teardown_method(self):
-        if self.old_env_level:
-            os.environ["UNFURL_LOGGING"] = self.old_env_level
+    @pytest.fixture(autouse=True)
+    def unset_env_level(self, monkeypatch):
+        # each test needs UNFURL_LOGGING unset; monkeypatch restores the original value afterwards
+        monkeypatch.delenv("UNFURL_LOGGING", raising=False)
 
     def test_default(self):
         level = detect_log_level(loglevel=None, quiet=False, verbose=0)
@@ -47,8 +44,8 @@ class TestLogLevelDetection:
         level = detect_log_level(loglevel=None, quiet=True, verbose=0)
         assert level is Levels.CRITICAL
 
-    def test_from_env_var(self):
-        os.environ["UNFURL_LOGGING"] = "DEBUG"
+    def test_from_env_var(self, monkeypatch):
+        monkeypatch.setenv("UNFURL_LOGGING", "DEBUG")
         level = detect_log_level(loglevel=None, quiet=False, verbose=0)
         assert level is Levels.DEBUG
 
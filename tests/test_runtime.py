@@ -120,6 +120,14 @@ class ExpandDocTest(unittest.TestCase):
         patch_dict(old, new)
         self.assertEqual(old, new)
 
+    def test_patch_list(self):
+        item = {"a": 1}
+        old = {"l": [item, {"b": 1}]}
+        patch_dict(old, {"l": [{"c": 1}, {"a": 1}]})
+        self.assertEqual(old, {"l": [{"c": 1}, {"a": 1}]})
+        # equal items in the old list are preserved
+        self.assertIs(old["l"][1], item)
+
     def test_missingInclude(self):
         doc1 = CommentedMap(
             [("+/a/c", None), ("a", {"+/b": None}), ("b", {"c": {"d": 1}})]
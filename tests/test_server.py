@@ -2,10 +2,14 @@ import json
 import os
 from pprint import pformat
 import re
+import shutil
+import socket
+import tempfile
 import threading
 import time
 import unittest
 import urllib.request
+from contextlib import contextmanager
 from functools import partial
 from multiprocessing import Process, set_start_method
 
@@ -19,7 +23,7 @@ from unfurl.packages import is_semver_compatible_with
 import pytest
 from tests.utils import init_project, run_cmd
 from unfurl.repo import GitRepo
-from unfurl.yamlloader import yaml
+from unfurl.yamlloader import yaml, load_yaml
 from unfurl.util import change_cwd, get_package_digest
 from base64 import b64encode
 
@@ -33,7 +37,8 @@ if UNFURL_TEST_REDIS_URL:
     # e.g. "unix:///home/user/gdk/redis/redis.socket?db=2"
     os.environ["CACHE_TYPE"] = "RedisCache"
     os.environ["CACHE_REDIS_URL"] = UNFURL_TEST_REDIS_URL
-    os.environ["CACHE_KEY_PREFIX"] = "test" + str(int(time.time())) + "::"
+    # include the pid so concurrent test runs don't share cache entries
+    os.environ["CACHE_KEY_PREFIX"] = f"test{int(time.time())}-{os.getpid()}::"
     # time out in 2 minutes so we don't fill up the cache with cruft:
     os.environ["CACHE_DEFAULT_TIMEOUT"] = "120"
 os.environ["CACHE_CLEAR_ON_START"] = "1"
@@ -87,28 +92,36 @@ delete_patch = """
 }]
 """
 
-_static_server_port = 8090
-_server_port = 8091
 CLOUD_TEST_SERVER = "https://unfurl.cloud"
 
+# reuse connections to the test servers across requests
+_session = requests.Session()
+
 
-#  Increment port just in case server ports aren't closed in time for next test
 #  NB: if server processes aren't terminated: pkill -fl spawn_main
 def _next_port():
-    global _server_port
-    _server_port += 1
-    return _server_port
+    # let the OS pick a free port instead of guessing one that might still be in use
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+# assigned by the OS too so concurrent test runs don't collide
+_static_server_port = _next_port()
 
 
 def start_server_process(proc, port):
     proc.start()
-    for _ in range(10):
-        time.sleep(0.2)
+    url = f"http://localhost:{port}/health?secret=secret"
+    # poll frequently so we return as soon as the server is up
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline and proc.is_alive():
         try:
-            url = f"http://localhost:{port}/health?secret=secret"
+            # check the port is accepting connections before making a full request
+            socket.create_connection(("localhost", port), timeout=0.1).close()
             urllib.request.urlopen(url)
-        except Exception as e:
-            pass
+        except Exception:
+            time.sleep(0.02)
         else:
             return proc
     return None
@@ -136,23 +149,33 @@ def start_envvar_server(port):
     return httpd, env_var_url
 
 
-@pytest.fixture()
-def runner():
-    runner = CliRunner()
-    with runner.isolated_filesystem() as tmpdir:
-        # server.serve('localhost', _static_server_port, 'secret', 'ensemble', {})
-        # "url": ,
-        os.environ["UNFURL_LOGGING"] = "TRACE"
-        server_process = Process(
-            target=server.serve,
-            args=("localhost", _static_server_port, "secret", ".", "", {}, CLOUD_TEST_SERVER),
-        )
-        assert start_server_process(server_process, _static_server_port)
+@contextmanager
+def static_server(port):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        # only the server process needs to run in tmpdir with trace logging,
+        # don't leave them in effect for the rest of the tests
+        with change_cwd(tmpdir), pytest.MonkeyPatch.context() as mp:
+            mp.setenv("UNFURL_LOGGING", "TRACE")
+            server_process = Process(
+                target=server.serve,
+                args=("localhost", port, "secret", ".", "", {}, CLOUD_TEST_SERVER),
+            )
+            assert start_server_process(server_process, port)
 
         yield server_process
 
         server_process.terminate()   # Gracefully shutdown the server (SIGTERM)
         server_process.join()   # Wait for the server to terminate
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+# these tests only query the server, so start it once for the whole module
+@pytest.fixture(scope="module")
+def runner():
+    with static_server(_static_server_port) as server_process:
+        yield server_process
 
 
 def commit_foo(val: str):
@@ -173,7 +196,8 @@ def set_up_deployment(runner, deployment):
     with open("remote/ensemble/ensemble.yaml", "w") as f:
         f.write(deployment)
 
-    repo = GitRepo(Repo.init('remote'))
+    # unfurl init already created the git repository
+    repo = GitRepo(Repo('remote'))
     repo.add_all('remote')
     repo.commit_files(["remote/ensemble/ensemble.yaml"], "Add deployment")
 
@@ -194,13 +218,13 @@ def set_up_deployment(runner, deployment):
 
 
 def test_server_health(runner: Process):
-    res = requests.get("http://localhost:8090/health", params={"secret": "secret"})
+    res = _session.get(f"http://localhost:{_static_server_port}/health", params={"secret": "secret"})
 
     assert res.status_code == 200
     assert res.content == b"OK"
 
 def test_server_version(runner: Process):
-    res = requests.get("http://localhost:8090/version", params={"secret": "secret"})
+    res = _session.get(f"http://localhost:{_static_server_port}/version", params={"secret": "secret"})
 
     assert res.status_code == 200
     assert re.match(rb"^1\..+\+\w+$", res.content) is not None
@@ -209,30 +233,25 @@ def test_gui_release():
     assert re.match(gui.release_url_pattern, gui.RELEASE_URL).group(1) == gui.TAG
     assert is_semver_compatible_with(gui.TAG, "v0.1.0-alpha.1")
 
-def test_server_authentication(runner: Process):
-    res = requests.get("http://localhost:8090/health")
-    assert res.status_code == 401
-    assert res.json()["code"] == "UNAUTHORIZED"
-
-    res = requests.get("http://localhost:8090/health", params={"secret": "secret"})
-    assert res.status_code == 200
-    assert res.content == b"OK"
-
-    res = requests.get("http://localhost:8090/health", params={"secret": "wrong"})
-    assert res.status_code == 401
-    assert res.json()["code"] == "UNAUTHORIZED"
-
-    res = requests.get(
-        "http://localhost:8090/health", headers={"Authorization": "Bearer secret"}
-    )
-    assert res.status_code == 200
-    assert res.content == b"OK"
-
-    res = requests.get(
-        "http://localhost:8090/health", headers={"Authorization": "Bearer wrong"}
+@pytest.mark.parametrize(
+    "params,headers,status_code",
+    [
+        ({}, {}, 401),
+        ({"secret": "secret"}, {}, 200),
+        ({"secret": "wrong"}, {}, 401),
+        ({}, {"Authorization": "Bearer secret"}, 200),
+        ({}, {"Authorization": "Bearer wrong"}, 401),
+    ],
+)
+def test_server_authentication(runner: Process, params, headers, status_code):
+    res = _session.get(
+        f"http://localhost:{_static_server_port}/health", params=params, headers=headers
     )
-    assert res.status_code == 401
-    assert res.json()["code"] == "UNAUTHORIZED"
+    assert res.status_code == status_code
+    if status_code == 200:
+        assert res.content == b"OK"
+    else:
+        assert res.json()["code"] == "UNAUTHORIZED"
 
 
 def test_server_export_local():
@@ -253,7 +272,7 @@ def test_server_export_local():
             )
             # compare the export request output to the export command output
             for export_format in ["deployment", "environments"]:
-                res = requests.get(
+                res = _session.get(
                     f"http://localhost:{port}/export?format={export_format}"
                 )
                 assert res.status_code == 200
@@ -307,7 +326,7 @@ def test_server_export_remote():
                 for msg in ("cache miss for", "cache hit for"):
                     # test caching
                     project_id = "onecommons/project-templates/dashboard"
-                    res = requests.get(
+                    res = _session.get(
                         f"http://localhost:{port}/export",
                         params={
                             "auth_project": project_id,
@@ -360,7 +379,7 @@ def test_server_export_remote():
                 ]
             )
             last_commit = GitRepo(Repo("application-blueprint")).revision
-            res = requests.get(
+            res = _session.get(
                 f"http://localhost:{port}/export",
                 params={
                     "auth_project": "onecommons/project-templates/application-blueprint",
@@ -390,7 +409,7 @@ def test_server_export_remote():
                                          ^ int(get_package_digest(), 16)
                                          ^ int(dep_commit, 16)))
             # # check that this public project (no auth header sent) was cached
-            res = requests.get(
+            res = _session.get(
                 f"http://localhost:{port}/export",
                 params={
                     "auth_project": "onecommons/project-templates/application-blueprint",
@@ -407,24 +426,26 @@ def test_server_export_remote():
             p.join()
 
 
-def test_populate_cache(runner: Process):
+def test_populate_cache():
     project_ids = ["onecommons/project-templates/dashboard", "onecommons/project-templates/dashboard",
                   "onecommons/project-templates/application-blueprint"]
     files = ["unfurl.yaml", "ensemble/ensemble.yaml", "ensemble-template.yaml"]
-    port = _static_server_port
-    for file_path, project_id in zip(files, project_ids):
-        res = requests.post(
-            f"http://localhost:{port}/populate_cache",
-            params={
-                "secret": "secret",
-                "auth_project": project_id,
-                "latest_commit": "HEAD",
-                "path": file_path,
-                "visibility": "public",
-            },
-        )
-        assert res.status_code == 200
-        assert res.content == b"OK"
+    port = _next_port()
+    # populate_cache clones projects into the server's directory so don't share the module's server
+    with static_server(port):
+        for file_path, project_id in zip(files, project_ids):
+            res = _session.post(
+                f"http://localhost:{port}/populate_cache",
+                params={
+                    "secret": "secret",
+                    "auth_project": project_id,
+                    "latest_commit": "HEAD",
+                    "path": file_path,
+                    "visibility": "public",
+                },
+            )
+            assert res.status_code == 200
+            assert res.content == b"OK"
 
 @unittest.skipIf(
     "slow" in os.getenv("UNFURL_TEST_SKIP", ""), "UNFURL_TEST_SKIP set"
@@ -438,7 +459,7 @@ def test_server_update_deployment():
             p, port, last_commit = set_up_deployment(runner, initial_deployment)
 
             target_patch = patch.format("target")
-            res = requests.post(
+            res = _session.post(
                 f"http://localhost:{port}/update_ensemble?auth_project=remote",
                 json={
                     "patch": json.loads(target_patch),
@@ -451,7 +472,7 @@ def test_server_update_deployment():
             last_commit = new_commit
             # os.system("git --git-dir server/public/remote/main/.git log -p")
 
-            res = requests.get(
+            res = _session.get(
                 f"http://localhost:{port}/export",
                 params={
                     "auth_project": "remote",
@@ -468,7 +489,8 @@ def test_server_update_deployment():
             os.system("git pull ../remote.git")
 
             with open("ensemble/ensemble.yaml", "r") as f:
-                data = yaml.load(f.read())
+                # only reading values, so use the faster read-only (libyaml) loader
+                data = load_yaml(yaml, f, "ensemble/ensemble.yaml", readonly=True)
                 assert (data['spec']
                             ['service_template']
                             ['topology_template']
@@ -493,7 +515,7 @@ def test_server_update_deployment():
 
             # test deleting
 
-            res = requests.post(
+            res = _session.post(
                 f"http://localhost:{port}/update_ensemble?auth_project=remote",
                 json={
                     "patch": json.loads(delete_patch),
@@ -508,7 +530,7 @@ def test_server_update_deployment():
             # so pull from there to verify the push
             os.system("git pull  ../remote.git")
             with open("ensemble/ensemble.yaml", "r") as f:
-                data = yaml.load(f.read())
+                data = load_yaml(yaml, f, "ensemble/ensemble.yaml", readonly=True)
                 assert not data['spec']['service_template']['topology_template']['node_templates']
 
             provider_patch = [{
@@ -527,7 +549,7 @@ def test_server_update_deployment():
               },
               "__typename": "DeploymentEnvironment"
             }]
-            res = requests.post(
+            res = _session.post(
                 f"http://localhost:{port}/create_provider?auth_project=remote",
                 json={
                     "environment":"gcp", "deployment_blueprint":None, "deployment_path": "environments/gcp/primary_provider",
@@ -541,12 +563,12 @@ def test_server_update_deployment():
 
             assert not os.system("git pull --commit --no-edit origin main")
             with open("unfurl.yaml", "r") as f:
-                data = yaml.load(f.read())
+                data = load_yaml(yaml, f, "unfurl.yaml", readonly=True)
                 # check that the environment was added and an ensemble was created
                 assert data["environments"]["gcp"]["connections"]["primary_provider"]["type"] == "unfurl.relationships.ConnectsTo.GoogleCloudProject"
                 assert data["ensembles"][0]["alias"] == "primary_provider", data
 
-            res = requests.post(
+            res = _session.post(
                 f"http://localhost:{port}/clear_project_file_cache?auth_project=remote",
             )
             # 'remote:main::localenv', 'remote:pull:...', 'remote:main:ensemble/ensemble.yaml:deployment'
@@ -7,6 +7,7 @@ import dataclasses
 from enum import Enum
 import functools
 import inspect
+import itertools
 import threading
 import typing
 import os.path
@@ -34,6 +35,7 @@ from typing import (
     overload,
 )
 import types
+import builtins
 from typing_extensions import (
     Protocol,
     Callable,
@@ -52,6 +54,10 @@ import logging
 
 logger = logging.getLogger("tosca")
 
+# dataclasses supports kw_only (and match_args, slots) fields
+_kw_only_supported = sys.version_info >= (3, 10)
+_field_kw_only: Dict[str, Any] = dict(kw_only=True) if _kw_only_supported else {}
+
 from toscaparser.elements.datatype import DataType as ToscaParserDataType
 from toscaparser import functions
 from .scalars import *
@@ -211,11 +217,15 @@ class schema(DataConstraint):
     pass
 
 
+_namespace_ignore = frozenset(
+    ("__doc__", "__module__", "__dict__", "__weakref__", "_tosca_name")
+)
+
+
 class Namespace(types.SimpleNamespace):
     @classmethod
     def get_defs(cls) -> Dict[str, Any]:
-        ignore = ("__doc__", "__module__", "__dict__", "__weakref__", "_tosca_name")
-        return {k: v for k, v in cls.__dict__.items() if k not in ignore}
+        return {k: v for k, v in cls.__dict__.items() if k not in _namespace_ignore}
 
     @classmethod
     def set_name(cls, obj, name):
@@ -234,6 +244,9 @@ class ServiceTemplate(Namespace):
         obj._name = name
 
 
+_blueprint_ignore = _namespace_ignore | frozenset(("to_yaml", "_fields", "get_defs"))
+
+
 class DeploymentBlueprint(Namespace):
     _fields = ("_cloud", "_title", "_description", "_visibility")
 
@@ -243,17 +256,8 @@ class DeploymentBlueprint(Namespace):
 
     @classmethod
     def get_defs(cls) -> Dict[str, Any]:
-        ignore = (
-            "to_yaml",
-            "_fields",
-            "get_defs",
-            "__doc__",
-            "__module__",
-            "__dict__",
-            "__weakref__",
-            "_tosca_name",
-        )
-        return {k: v for k, v in cls.__dict__.items() if k not in ignore + cls._fields}
+        ignore = _blueprint_ignore.union(cls._fields)
+        return {k: v for k, v in cls.__dict__.items() if k not in ignore}
 
     @classmethod
     def to_yaml(cls, converter: "PythonToYaml") -> None:
@@ -413,6 +417,14 @@ PYTHON_TO_TOSCA_TYPES.update(
     }
 )
 
+# the same mapping keyed by class for the types defined here or in builtins
+_PYTHON_CLASS_TO_TOSCA_TYPES: Dict[type, str] = {}
+for _name, _tosca_type in PYTHON_TO_TOSCA_TYPES.items():
+    _cls = globals().get(_name, getattr(builtins, _name, None))
+    if isinstance(_cls, type):
+        _PYTHON_CLASS_TO_TOSCA_TYPES[_cls] = _tosca_type
+del _name, _tosca_type, _cls
+
 TOSCA_SHORT_NAMES = {
     "PortDef": "tosca.datatypes.network.PortDef",
     "PortSpec": "tosca.datatypes.network.PortSpec",
@@ -420,17 +432,21 @@ TOSCA_SHORT_NAMES = {
 
 
 def _to_union(types):
-    if len(types) == 3:
-        return Union[types[0], types[1], types[2]]
-    elif len(types) == 2:
-        return Union[types[0], types[1]]
-    else:
+    if len(types) == 1:
         return ForwardRef(types[0])
+    return Union[tuple(types)]
 
 
 def _get_type_name(_type):
     # work-around _SpecialType limitations in older Python versions
-    return getattr(_type, "__name__", getattr(_type, "_name", ""))
+    try:
+        return _type.__name__
+    except AttributeError:
+        return getattr(_type, "_name", "")
+
+
+_NoneType = type(None)
+_union_type_names = ("Union", "UnionType")
 
 
 def get_optional_type(_type) -> Tuple[bool, Any]:
@@ -445,14 +461,18 @@ def get_optional_type(_type) -> Tuple[bool, Any]:
             return True, _to_union(union)
         except ValueError:
             return False, _to_union(union)
-    args = get_args(_type)
     origin = get_origin(_type)
-    if (
-        origin
-        and _get_type_name(origin) in ["Union", "UnionType"]
-        and type(None) in args
-    ):
-        _types = [arg for arg in args if arg is not type(None)]
+    if origin and _get_type_name(origin) in _union_type_names:
+        args = get_args(_type)
+        if len(args) == 2:  # fast path for Optional[T]
+            if args[1] is _NoneType:
+                return True, args[0]
+            if args[0] is _NoneType:
+                return True, args[1]
+            return False, _type
+        if _NoneType not in args:
+            return False, _type
+        _types = [arg for arg in args if arg is not _NoneType]
         if not _types:
             return True, type(None)
         elif len(_types) > 1:  # return origin type
@@ -486,25 +506,37 @@ class TypeInfo(NamedTuple):
             return True
         if self.collection:
             if isinstance(value, Collection_Types):
-                for item in value:
-                    if not isinstance(item, self.simple_types):
-                        return False
-                return True
+                simple_types = self.simple_types
+                return all(isinstance(item, simple_types) for item in value)
             return False
         elif isinstance(value, self.types):
             return True
         return False
 
 
+def _type_cache_key(_type) -> tuple:
+    # Union[A, B] == Union[B, A] but TypeInfo.types preserves the order, so include it in the key
+    return (_type, tuple(_type_cache_key(arg) for arg in get_args(_type)))
+
+
 def pytype_to_tosca_type(_type, as_str=False) -> TypeInfo:
+    key = _type_cache_key(_type)
+    try:
+        hash(key)
+    except TypeError:  # unhashable, e.g. Annotated with a list
+        return _pytype_to_tosca_type(_type, as_str)
+    return _cached_pytype_to_tosca_type(key, as_str)
+
+
+def _pytype_to_tosca_type(_type, as_str=False) -> TypeInfo:
     optional, _type = get_optional_type(_type)
     origin = get_origin(_type)
     if origin is Annotated:
         metadata = _type.__metadata__[0]
         _type = get_args(_type)[0]
+        origin = get_origin(_type)
     else:
         metadata = None
-    origin = get_origin(_type)
     collection = None
     if origin == collections.abc.Sequence:
         collection = list
@@ -513,7 +545,7 @@ def pytype_to_tosca_type(_type, as_str=False) -> TypeInfo:
     if collection:
         args = get_args(_type)
         if args:
-            _type = get_args(_type)[1 if origin is dict else 0]
+            _type = args[1 if origin is dict else 0]
         else:
             _type = Any
         origin = get_origin(_type)
@@ -522,7 +554,7 @@ def pytype_to_tosca_type(_type, as_str=False) -> TypeInfo:
         types: tuple = tuple(
             ForwardRef(t.strip()) for t in _type.__forward_arg__.split("|")
         )
-    elif _get_type_name(origin) in ["Union", "UnionType"]:
+    elif _get_type_name(origin) in _union_type_names:
         types = get_args(_type)
     else:
         types = (_type,)
@@ -542,7 +574,18 @@ def pytype_to_tosca_type(_type, as_str=False) -> TypeInfo:
     return TypeInfo(optional, collection, types, metadata)
 
 
+# TypeInfo is immutable so results can be shared
+@functools.lru_cache(maxsize=4096)
+def _cached_pytype_to_tosca_type(key: tuple, as_str: bool) -> TypeInfo:
+    return _pytype_to_tosca_type(key[0], as_str)
+
+
+_json_leaf_types = frozenset((str, int, float, bool, type(None)))
+
+
 def to_tosca_value(obj, dict_cls=dict):
+    if type(obj) in _json_leaf_types:  # fast path for the common case
+        return obj
     if isinstance(obj, dict):
         return dict_cls((k, to_tosca_value(v, dict_cls)) for k, v in obj.items())
     elif isinstance(obj, list):
@@ -607,7 +650,8 @@ class Options:
             data (Dict[str, JsonType]): Metadata to be add to the field specifier.
         """
         self.data = data
-        self.next: Optional[Options] = None
+        # Options merged after this one, flattened
+        self._rest: Tuple[Options, ...] = ()
 
     def validate(self, field: "_Tosca_Field") -> Tuple[bool, str]:
         """
@@ -623,43 +667,44 @@ class Options:
         return True, ""
 
     def set_options(self, field: "_Tosca_Field"):
-        metadata = field.metadata.copy()
-        option: Optional[Options] = self
-        while option:
-            metadata.update(option.data)
-            option = option.next
-        field.metadata = types.MappingProxyType(metadata)
-
-        option = self
-        while option:
+        options = (self,) + self._rest
+        if any(option.data for option in options):
+            metadata = dict(field.metadata)
+            for option in options:
+                metadata.update(option.data)
+            field.metadata = types.MappingProxyType(metadata)
+
+        for option in options:
             valid, msg = option.validate(field)
             if not valid:
                 raise ValueError(
                     f'Invalid option for field "{field.name}": {option.data}. {msg}'
                 )
-            option = option.next
 
-    def __or__(self, __value: Union["Options", dict]) -> "Options":
+    def _merge(self, __value: Union["Options", dict]) -> "Options":
+        # return a new Options instead of modifying self, Options are often shared (e.g. module constants)
         if isinstance(__value, dict):
             __value = Options(__value)
         elif not isinstance(__value, Options):
             raise TypeError(f"Options | {type(__value)} not supported.")
-        self.next = __value
-        return self
+        merged = copy.copy(self)
+        merged._rest = self._rest + (__value,) + __value._rest
+        return merged
+
+    def __or__(self, __value: Union["Options", dict]) -> "Options":
+        return self._merge(__value)
 
     def __ror__(self, __value: Union["Options", dict]) -> "Options":
+        # __value is the left operand so it needs to come first in the chain
         if isinstance(__value, dict):
-            __value = Options(__value)
-        elif not isinstance(__value, Options):
-            raise TypeError(f"Options | {type(__value)} not supported.")
-        self.next = __value
-        return self
+            return Options(__value)._merge(self)
+        raise TypeError(f"{type(__value)} | Options not supported.")
 
 
 class PropertyOptions(Options):
     def validate(self, field: "_Tosca_Field") -> Tuple[bool, str]:
         return (
-            field.tosca_field_type == ToscaFieldType.property,
+            field.tosca_field_type is ToscaFieldType.property,
             "This option only works with properties.",
         )
 
@@ -667,7 +712,7 @@ class PropertyOptions(Options):
 class AttributeOptions(Options):
     def validate(self, field: "_Tosca_Field") -> Tuple[bool, str]:
         return (
-            field.tosca_field_type == ToscaFieldType.attribute,
+            field.tosca_field_type is ToscaFieldType.attribute,
             "This option only works with attributes.",
         )
 
@@ -697,30 +742,27 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
         declare_attribute: bool = False,
         owner: Optional[Type["_ToscaType"]] = None,
     ):
-        if metadata is None:
-            metadata = {}
-        args = [
-            self,
-            default,
-            default_factory,
-            field_type != ToscaFieldType.attribute,  # init
-            True,  # repr
-            None,  # hash
-            True,  # compare
-            metadata or {},
-        ]
-        _has_default = (
-            default is not dataclasses.MISSING
-            or default_factory is not dataclasses.MISSING
-        )
-        if sys.version_info.minor > 9:
-            args.append(True)  # kw_only
-        elif not _has_default:
+        if (
+            not _kw_only_supported
+            and default is dataclasses.MISSING
+            and default_factory is dataclasses.MISSING
+        ):
             # we have to have all fields have a default value
             # because the ToscaType base classes have init fields with default values
             # and python < 3.10 dataclasses will raise an error
-            args[1] = REQUIRED  # set default
-        dataclasses.Field.__init__(*args)
+            default = REQUIRED
+        # pass by keyword, Field.__init__'s positional parameters vary across Python versions
+        dataclasses.Field.__init__(
+            self,
+            default=default,
+            default_factory=default_factory,
+            init=field_type is not ToscaFieldType.attribute,
+            repr=True,
+            hash=None,
+            compare=True,
+            metadata=metadata or {},
+            **_field_kw_only,
+        )
         self.owner = owner
         self._tosca_field_type = field_type
         self._tosca_name = name
@@ -732,7 +774,8 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
         self.constraints: List[DataConstraint] = constraints or []
         if options:
             options.set_options(self)
-        self.deferred_property_assignments: Dict[str, Any] = {}
+        # created on demand, most fields never have deferred assignments
+        self.deferred_property_assignments: Optional[Dict[str, Any]] = None
         self._type_info: Optional[TypeInfo] = None
 
     def set_constraint(self, val):
@@ -772,6 +815,8 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
             )
         elif self.default_factory is not MISSING:
             # default exists but not created until object initialization
+            if self.deferred_property_assignments is None:
+                self.deferred_property_assignments = {}
             self.deferred_property_assignments[name] = val
         else:
             # XXX validate name is valid property and that val is compatible type
@@ -823,7 +868,7 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
             assert prop_name
             cap_filters = root_node_filter.setdefault("capabilities", [])
             for cap_filter in cap_filters:
-                if list(cap_filter)[0] == capability:
+                if next(iter(cap_filter)) == capability:
                     node_filter = cap_filter[capability]
                     break
             else:
@@ -895,7 +940,7 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
         return self.owner._resolve_class(_type)
 
     def get_type_info(self) -> TypeInfo:
-        if not self._type_info:
+        if self._type_info is None:
             type_info = pytype_to_tosca_type(self.type)
             types = tuple(self._resolve_class(t) for t in type_info.types)
             self._type_info = type_info._replace(types=types)
@@ -915,13 +960,15 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
         for _type in type_info.types:
             if not isinstance(_type, type):
                 continue
-            if issubclass(_type, Node) or issubclass(_type, Relationship):
+            # _type_section is a cheaper test than issubclass() against each base class
+            section = getattr(_type, "_type_section", None)
+            if section == "node_types" or section == "relationship_types":
                 field_type = ToscaFieldType.requirement
                 break
-            elif issubclass(_type, ArtifactType):
+            elif section == "artifact_types":
                 field_type = ToscaFieldType.artifact
                 break
-            elif issubclass(_type, CapabilityType):
+            elif section == "capability_types":
                 has_capability = True
         else:
             if has_capability:
@@ -952,15 +999,16 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
         converter: Optional["PythonToYaml"],
         super_field: Optional["_Tosca_Field"] = None,
     ) -> dict:
-        if self.tosca_field_type == ToscaFieldType.property:
+        field_type = self.tosca_field_type
+        if field_type is ToscaFieldType.property:
             field_def = self._to_property_yaml()
-        elif self.tosca_field_type == ToscaFieldType.attribute:
+        elif field_type is ToscaFieldType.attribute:
             field_def = self._to_attribute_yaml()
-        elif self.tosca_field_type == ToscaFieldType.requirement:
+        elif field_type is ToscaFieldType.requirement:
             field_def = self._to_requirement_yaml(converter, super_field)
-        elif self.tosca_field_type == ToscaFieldType.capability:
+        elif field_type is ToscaFieldType.capability:
             field_def = self._to_capability_yaml(super_field)
-        elif self.tosca_field_type == ToscaFieldType.artifact:
+        elif field_type is ToscaFieldType.artifact:
             field_def = self._to_artifact_yaml(converter)
         elif self.name == "_target":  # _target handled in _to_requirement_yaml
             return {}
@@ -984,10 +1032,16 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
             occurrences[1] = "UNBOUNDED"  # type: ignore
         return occurrences
 
-    def _add_occurrences(self, field_def: dict, default=(1, 1)) -> None:
+    def _add_occurrences(
+        self, field_def: dict, super_field: Optional["_Tosca_Field"] = None
+    ) -> None:
         occurrences = self._get_occurrences()
-        if occurrences != list(default):
-            field_def["occurrences"] = occurrences
+        if super_field:  # only add if different from the field it overrides
+            if occurrences == super_field._get_occurrences():
+                return
+        elif occurrences[0] == 1 and occurrences[1] == 1:  # the TOSCA default
+            return
+        field_def["occurrences"] = occurrences
 
     def _resolve_toscaname(self, candidate) -> str:
         if isinstance(candidate, str):
@@ -1012,15 +1066,16 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
             return req_def
         target_typeinfo = None
         for _type in info.types:
-            if issubclass(_type, Relationship):
+            section = getattr(_type, "_type_section", None)
+            if section == "relationship_types":
                 req_def["relationship"] = _type.tosca_type_name()
                 target_field = _type.__dataclass_fields__.get("_target")
                 target_typeinfo = cast(
                     _Tosca_Field, target_field
                 ).get_type_info_checked()
-            elif issubclass(_type, CapabilityType):
+            elif section == "capability_types":
                 req_def["capability"] = _type.tosca_type_name()
-            elif issubclass(_type, Node):
+            elif section == "node_types":
                 req_def["node"] = _type.tosca_type_name()
         if "node" not in req_def and target_typeinfo:
             req_def["node"] = target_typeinfo.types[0].tosca_type_name()
@@ -1039,11 +1094,7 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
                     )
             elif default and default not in [MISSING, REQUIRED]:
                 converter.set_requirement_value(req_def, self, default, self.name)
-        if super_field:
-            default_occurrences = super_field._get_occurrences()
-        else:
-            default_occurrences = [1, 1]
-        self._add_occurrences(req_def, default_occurrences)
+        self._add_occurrences(req_def, super_field)
         return req_def
 
     def _to_capability_yaml(
@@ -1056,11 +1107,7 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
         _type = info.types[0]
         assert issubclass(_type, _ToscaType), (self, _type)
         cap_def: dict = yaml_cls(type=_type.tosca_type_name())
-        if super_field:
-            default_occurrences = super_field._get_occurrences()
-        else:
-            default_occurrences = [1, 1]
-        self._add_occurrences(cap_def, default_occurrences)
+        self._add_occurrences(cap_def, super_field)
         # XXX if self.default or self.default_factory: save properties
         if self.valid_source_types:  # is not None: XXX only set to [] if declared
             cap_def["valid_source_types"] = self.valid_source_types
@@ -1097,7 +1144,9 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
             tosca_type = "list"
         else:
             _type = self._resolve_class(_type)
-            tosca_type = PYTHON_TO_TOSCA_TYPES.get(_get_type_name(_type), "")
+            tosca_type = _PYTHON_CLASS_TO_TOSCA_TYPES.get(
+                _type
+            ) or PYTHON_TO_TOSCA_TYPES.get(_get_type_name(_type), "")
             if not tosca_type:  # it must be a datatype
                 if not issubclass(_type, _BaseDataType):
                     raise TypeError(f"unrecognized value type: {_type}")
@@ -1189,7 +1238,7 @@ class _Tosca_Field(dataclasses.Field, Generic[_T]):
 
 def _make_field_doc(func, status=False, extra: Sequence[str] = ()) -> None:
     name = func.__name__.lower()
-    doc = f"""Field specifier for declaring a TOSCA {name}.
+    header = f"""Field specifier for declaring a TOSCA {name}.
 
     Args:
         default (Any, optional): Default value. Set to None if the {name} isn't required. Defaults to MISSING.
@@ -1198,13 +1247,17 @@ def _make_field_doc(func, status=False, extra: Sequence[str] = ()) -> None:
         metadata (Dict[str, JSON], optional): Dictionary of metadata to associate with the {name}.
         options (Options, optional): Additional typed metadata to merge into metadata.\n"""
     indent = "        "
+    parts = [header]
     if status:
-        doc += f"{indent}constraints (List[`DataConstraint`], optional): List of TOSCA property constraints to apply to the {name}.\n"
-        doc += f"{indent}title (str, optional): Human-friendly alternative name of the {name}.\n"
-        doc += f"{indent}status (str, optional): TOSCA status of the {name}.\n"
-    for arg in extra:
-        doc += f"{indent}{arg}\n"
-    func.__doc__ = doc
+        parts.append(
+            f"{indent}constraints (List[`DataConstraint`], optional): List of TOSCA property constraints to apply to the {name}.\n"
+        )
+        parts.append(
+            f"{indent}title (str, optional): Human-friendly alternative name of the {name}.\n"
+        )
+        parts.append(f"{indent}status (str, optional): TOSCA status of the {name}.\n")
+    parts.extend(f"{indent}{arg}\n" for arg in extra)
+    func.__doc__ = "".join(parts)
 
 
 # cf @overloads here: https://github.com/python/typeshed/blob/main/stdlib/dataclasses.pyi#L159
@@ -1933,7 +1986,7 @@ def _make_dataclass(cls):
         unsafe_hash=True,
         frozen=False,
     )
-    if sys.version_info.minor > 9:
+    if _kw_only_supported:
         kw["match_args"] = True
         kw["kw_only"] = True
         kw["slots"] = False
@@ -1972,6 +2025,7 @@ def _make_dataclass(cls):
                     if field:
                         field.name = name
                         field.type = annotation
+                        field._type_info = None  # type (and owner) may have changed
                         if default is DEFAULT:
                             field.default = MISSING
                             field.default_factory = field.make_default()
@@ -2110,7 +2164,7 @@ def field(
     builtin=False,
 ) -> Any:
     kw: Dict[str, Any] = dict(default=default, default_factory=default_factory)
-    if sys.version_info.minor > 9:
+    if _kw_only_supported:
         kw["kw_only"] = kw_only
         if default is REQUIRED:
             # we don't need this default placeholder set if Python supports kw_only fields
@@ -2124,6 +2178,10 @@ def field(
     return dataclasses.field(**kw)
 
 
+# matches the item type in string annotations like "List[Foo]"
+_nested_type_regex = re.compile(r"\[(\w+)\]")
+
+
 @dataclass_transform(
     kw_only_default=True,
     field_specifiers=(
@@ -2229,7 +2287,7 @@ class _ToscaType(ToscaObject, metaclass=_DataclassType):
             _type = get_args(_type)[0]
         if isinstance(_type, str):
             if "[" in _type:
-                match = re.search(r"\[(\w+)\]", _type)
+                match = _nested_type_regex.search(_type)
                 if match and match.group(1):
                     _type = match.group(1)
                 else:
@@ -2242,8 +2300,7 @@ class _ToscaType(ToscaObject, metaclass=_DataclassType):
 
     @classmethod
     def _lookup_class(cls, qname: str):
-        names = qname.split(".")
-        name = names.pop(0)
+        name, sep, rest = qname.partition(".")
         if cls._globals:
             globals = cls._globals
         else:
@@ -2264,12 +2321,11 @@ class _ToscaType(ToscaObject, metaclass=_DataclassType):
                 obj = sys.modules[name]
             else:
                 raise NameError(f"{qname} not found in {cls.__name__}'s scope")
-        while names:
-            name = names.pop(0)
-            ns = obj
-            obj = getattr(obj, name, None)
-            if obj is None:
-                raise AttributeError(f"can't find {name} in {qname}")
+        if sep:
+            for name in rest.split("."):
+                obj = getattr(obj, name, None)
+                if obj is None:
+                    raise AttributeError(f"can't find {name} in {qname}")
         return obj
 
 
@@ -2708,15 +2764,16 @@ class ToscaType(_ToscaType):
         dict_cls = converter and converter.yaml_cls or yaml_cls
         body: Dict[str, Any] = dict_cls()
         tosca_name = cls.tosca_type_name()
+        base_classes = list(cls.tosca_bases())
         bases: Union[list, str] = [
-            b.tosca_type_name() for b in cls.tosca_bases() if b != tosca_name
+            b.tosca_type_name() for b in base_classes if b != tosca_name
         ]
         super_fields = {}
         if bases:
             if len(bases) == 1:
                 bases = bases[0]
             body["derived_from"] = bases
-            for b in cls.tosca_bases():
+            for b in base_classes:
                 super_fields.update(b.__dataclass_fields__)
 
         doc = cls.__doc__ and cls.__doc__.strip()
@@ -3452,6 +3509,11 @@ class _ToscaTypeProxy:
         return _ArtifactProxy(name_or_tpl)
 
 
+# the comment added by WritePolicy.generate_comment(), always at the top of the file
+_generated_comment_regex = re.compile(r"# Generated by .+? at (\S+) overwrite (ok)?")
+_generated_comment_max_offset = 4096
+
+
 class WritePolicy(Enum):
     older = "older"
     never = "never"
@@ -3497,44 +3559,53 @@ class WritePolicy(Enum):
             return not is_newer_than(output_path, input_path), False
         else:  # auto
             # if this file is autogenerated, parse out the modified time and make sure it matches
-            if not os.path.exists(output_path):
+            try:
+                mtime = os.stat(output_path).st_mtime
+            except FileNotFoundError:
                 return True, False
             with open(output_path) as out:
-                contents = out.read()
-                match = re.search(
-                    r"# Generated by .+? at (\S+) overwrite (ok)?", contents
-                )
+                # only read the header until we know we need to compare the contents
+                header = out.read(_generated_comment_max_offset)
+                match = _generated_comment_regex.search(header)
                 if not match:
                     return False, False
-                if match.group(2):  # found "ok"
-                    return True, self.has_contents_unchanged(new_src, contents)
-                time = datetime.datetime.fromisoformat(match.group(1)).timestamp()
-            if abs(time - os.stat(output_path).st_mtime) < 5:
-                return True, self.has_contents_unchanged(new_src, contents)
-            return False, False
+                if not match.group(2):  # didn't find "ok"
+                    time = datetime.datetime.fromisoformat(match.group(1)).timestamp()
+                    if abs(time - mtime) >= 5:
+                        return False, False
+                if new_src is None:
+                    return True, False
+                contents = header + out.read()
+            return True, self.has_contents_unchanged(new_src, contents)
 
     def has_contents_unchanged(self, new_src: Optional[str], old_src: str) -> bool:
         if new_src is None:
             return False
-        new_lines = [
-            l.strip()
-            for l in new_src.splitlines()
-            if l.strip() and not l.startswith("#")
-        ]
-        old_lines = [
-            l.strip()
-            for l in old_src.splitlines()
-            if l.strip() and not l.startswith("#")
-        ]
-        if len(new_lines) == len(old_lines):
-            return new_lines == old_lines
-        return False
+        if new_src == old_src:  # fast path
+            return True
+        # compare lazily so we stop at the first difference
+        # (zip_longest pads with None so a length mismatch compares unequal)
+        return all(
+            new == old
+            for new, old in itertools.zip_longest(
+                _significant_lines(new_src), _significant_lines(old_src)
+            )
+        )
+
+
+def _significant_lines(src: str) -> Iterator[str]:
+    # skip blank lines and comments
+    for line in src.splitlines():
+        stripped = line.strip()
+        if stripped and not line.startswith("#"):
+            yield stripped
 
 
 def is_newer_than(output_path, input_path):
     "Is output_path newer than input_path?"
-    if not os.path.exists(input_path) or not os.path.exists(output_path):
+    try:
+        input_mtime = os.stat(input_path).st_mtime_ns
+        output_mtime = os.stat(output_path).st_mtime_ns
+    except FileNotFoundError:
         return True  # assume that if it doesn't exist yet its definitely newer
-    if os.stat(output_path).st_mtime_ns > os.stat(input_path).st_mtime_ns:
-        return True
-    return False
+    return output_mtime > input_mtime
@@ -57,9 +57,6 @@ from toscaparser.elements.scalarunit import get_scalarunit_class
 from keyword import iskeyword
 import collections.abc
 from . import WritePolicy, _tosca, ToscaFieldType, loader, __all__
-import black
-import black.mode
-import black.report
 
 try:
     import unfurl
@@ -2030,6 +2027,11 @@ def convert_service_template(
     # src += '\nif __name__ == "__main__":\n    tosca.dump_yaml(globals())'
 
     if format:
+        # black is slow to import and only needed here
+        import black
+        import black.mode
+        import black.report
+
         try:
             src = black.format_file_contents(src, fast=True, mode=black.mode.Mode())
         except black.report.NothingChanged:
@@ -1,12 +1,11 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2020 Adam Souzis
+from functools import lru_cache
 import logging
 import os
 import sys
 from typing import Dict, Optional, Union, TYPE_CHECKING
 
-import pbr.version
-
 from . import logs
 
 
@@ -14,8 +13,11 @@ from . import logs
 logs.initialize_logging()
 
 
+@lru_cache(maxsize=None)
 def __version__(include_prerelease: bool = False) -> str:
-    # this is expensive so make this a function to calculate lazily
+    # this is expensive so make this a function to calculate lazily (and only once)
+    import pbr.version
+
     if include_prerelease:
         # if running from a repository appends .devNNN using something like git describe
         return pbr.version.VersionInfo(__name__).release_string()
@@ -11,7 +11,6 @@ from typing import Any, Dict, Optional, cast, TYPE_CHECKING
 import uuid
 import zipfile
 from jinja2.loaders import FileSystemLoader
-from pathlib import Path
 
 from . import DefaultNames, __version__, get_home_config_path, is_version_unreleased
 from .localenv import LocalEnv, Project, LocalConfig
@@ -32,7 +31,7 @@ from .util import (
     substitute_env,
 )
 from .tosca_plugins.functions import get_random_password
-from .yamlloader import make_yaml, make_vault_lib, yaml
+from .yamlloader import load_yaml, make_yaml, make_vault_lib, yaml
 from .venv import init_engine
 from .logs import getLogger
 from toscaparser.prereq.csar import CSAR, TOSCA_META
@@ -684,7 +683,10 @@ def _find_templates(sourceProject: Project, sourcePath: str):
         sourceDir = sourceProject.get_relative_path(template[0])
         return dict(sourceDir=sourceDir, serviceTemplate=template[1])
     if os.path.isfile(os.path.join(sourcePath, TOSCA_META)):
-        service_template = yaml.load(Path(sourcePath) / TOSCA_META)['Entry-Definitions']
+        # read-only so use the faster libyaml-backed loader instead of ruamel's round-trip loader
+        with open(os.path.join(sourcePath, TOSCA_META)) as f:
+            metadata = load_yaml(yaml, f, TOSCA_META, readonly=True)
+        service_template = metadata["Entry-Definitions"]
         sourceDir = sourceProject.get_relative_path(sourcePath)
         return dict(sourceDir=sourceDir, serviceTemplate=service_template)
     return None
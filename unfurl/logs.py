@@ -24,6 +24,7 @@ DEFAULT_TRUNCATE_LENGTH =  int(os.getenv("UNFURL_LOG_TRUNCATE") or 748)
 
 sensitive_params = ("private_token", "secret")
 sensitive_params_regex = re.compile(rf"({'|'.join(sensitive_params)})=[^&\s]+")
+url_credentials_regex = re.compile(r"//(\S{1,100}):(\S{1,200})@")
 
 def truncate(s: str, max: int = DEFAULT_TRUNCATE_LENGTH, omitted="omitted...") -> str:
     if not s:
@@ -192,7 +193,7 @@ class SensitiveFilter(logging.Filter):
                 self.redact(k): self.redact(v) for k, v in record.args.items()  # type: ignore
             }
         else:
-            if record.args is not None:
+            if record.args:
                 record.args = tuple(self.redact(a) for a in record.args)
         if isinstance(record.msg, str):
             record.msg = self.sanitize_urls(record.msg)
@@ -200,8 +201,13 @@ class SensitiveFilter(logging.Filter):
 
     @staticmethod
     def sanitize_urls(value: str) -> str:
-        value = re.sub(r"//(\S{1,100}):(\S{1,200})@", r"//\1:XXXXX@", value)
-        return re.sub(sensitive_params_regex, r"\1=XXXXX", value)
+        # this is called on every log message and argument so skip the regexes
+        # when they can't match
+        if "@" in value:
+            value = url_credentials_regex.sub(r"//\1:XXXXX@", value)
+        if "=" in value:
+            value = sensitive_params_regex.sub(r"\1=XXXXX", value)
+        return value
 
     @staticmethod
     def redact(value: Union[sensitive, str, object]) -> Union[str, object]:
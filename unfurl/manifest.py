@@ -74,6 +74,9 @@ logger = getLogger("unfurl")
 
 _basepath = os.path.abspath(os.path.dirname(__file__))
 
+# statuses that don't imply an instance was created if it has no changes recorded
+_unchanged_statuses = frozenset([Status.unknown, Status.ok, Status.pending])
+
 
 def relabel_dict(environment: Dict, localEnv: "LocalEnv", key: str) -> Dict[str, Any]:
     """Retrieve environment dictionary and remap any values that are strings in the dictionary by treating them as keys into an environment."""
@@ -125,7 +128,7 @@ class Manifest(AttributeManager):
         self.repo = self._find_repo()
         self.currentCommitId = self.repo and self.repo.revision
         # self.revisions = RevisionManager(self)
-        self.changeSets: Optional[Dict[str, ChangeRecordRecord]] = None
+        self._changeSets: Optional[Dict[str, ChangeRecordRecord]] = None
         self.tosca: Optional[ToscaSpec] = None
         self.specDigest = None
         self.repositories: Dict[str, RepoView] = {}
@@ -141,6 +144,20 @@ class Manifest(AttributeManager):
         self.imports.manifest = self
         self.modules: Optional[Dict] = None
 
+    @property
+    def changeSets(self) -> Optional[Dict[str, ChangeRecordRecord]]:
+        if self._changeSets is None:
+            self._changeSets = self._load_change_sets()
+        return self._changeSets
+
+    @changeSets.setter
+    def changeSets(self, changeSets: Optional[Dict[str, ChangeRecordRecord]]) -> None:
+        self._changeSets = changeSets
+
+    def _load_change_sets(self) -> Optional[Dict[str, ChangeRecordRecord]]:
+        # subclasses can override to defer loading change history until it is needed
+        return None
+
     def _add_repositories_from_environment(self) -> None:
         assert self.localEnv
         context = self.localEnv.get_context()
@@ -465,6 +482,9 @@ class Manifest(AttributeManager):
         resourceSpec: Dict[str, Any],
         parent: HasInstancesInstance,
     ) -> NodeInstance:
+        if isinstance(resourceSpec, CommentedMap):
+            # read from a plain dict: CommentedMap.get() is much slower, especially on misses
+            resourceSpec = dict(resourceSpec)
         # if parent property is set it overrides the parent argument
         root: ResourceRef = assert_not_none(parent.root)
         pname = resourceSpec.get("parent")
@@ -508,7 +528,7 @@ class Manifest(AttributeManager):
     def _get_last_config_changeset(self, operational):
         if not operational.last_config_change:
             return None
-        if not self.changeSets:  # XXX load changesets if None
+        if not self.changeSets:
             return None
         jobId = ChangeRecord.get_job_id(operational.last_config_change)
         return self.changeSets.get(jobId)
@@ -516,6 +536,8 @@ class Manifest(AttributeManager):
     def _create_entity_instance(
         self, ctor, name: str, status: Dict[str, Any], parent: EntityInstance
     ):
+        if isinstance(status, CommentedMap):
+            status = dict(status)  # see create_node_instance
         templateName = status.get("template", name)
 
         imported = None
@@ -582,14 +604,12 @@ class Manifest(AttributeManager):
     def is_instantiated(resource, checkstatus=True) -> bool:
         if "virtual" in resource.template.directives:
             return False
-        if not resource.last_change and (
-            not resource.local_status
-            or (
-                checkstatus
-                and resource.local_status in [Status.unknown, Status.ok, Status.pending]
-            )
-        ):
-            return False
+        if not resource.last_change:
+            local_status = resource.local_status
+            if not local_status or (
+                checkstatus and local_status in _unchanged_statuses
+            ):
+                return False
         return True
 
     def status_summary(self, verbose=False):
@@ -632,6 +632,14 @@ def diff_dicts(old, new, cls=dict, skipkeys=()):
     return diff
 
 
+def _find_equal(seq: Sequence, item: Any) -> Any:
+    # scan seq once for an equal item (rather than "in" followed by index())
+    try:
+        return seq[seq.index(item)]
+    except ValueError:
+        return item
+
+
 # XXX rename function, confusing name
 def patch_dict(old: MutableMapping, new: Mapping, preserve=False) -> MutableMapping:
     """
@@ -654,10 +662,7 @@ def patch_dict(old: MutableMapping, new: Mapping, preserve=False) -> MutableMapp
                         old[key] = val + [item for item in newval if item not in val]  # type: ignore
                     else:
                         # preserve old item in list if they are equal to the new item
-                        old[key] = [
-                            (val[val.index(item)] if item in val else item)
-                            for item in newval
-                        ]
+                        old[key] = [_find_equal(val, item) for item in newval]
                 else:
                     old[key] = newval
         elif not preserve:
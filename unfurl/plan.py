@@ -651,7 +651,7 @@ class Plan:
                 while True:
                     task = stepGenerator.send(result)
                     if isinstance(task, list):  # more steps
-                        queue.extend([workflow.get_step(stepName) for stepName in task])
+                        queue.extend(workflow.get_step(stepName) for stepName in task)
                         break
                     else:
                         result = yield task
@@ -314,16 +314,13 @@ class ChangeRecord:
         terms = log.split("\t")
         if not terms:
             raise UnfurlError(f'can not parse ChangeRecord from "{log}"')
+        changeId = terms[0]
+        self.changeId = changeId
+        self.taskId = int(changeId[-4:], 16)
         attributes = dict(startTime=None)
-        for i, term in enumerate(terms):
-            if i == 0:
-                self.changeId = term
-                self.taskId = int(term[-4:], 16)
-            # elif i == 1 and '=' not in term:
-            #     self.parentId=ChangeId(term)
-            else:
-                left, sep, right = term.partition("=")
-                attributes[left] = right  # type: ignore
+        for term in terms[1:]:
+            left, sep, right = term.partition("=")
+            attributes[left] = right  # type: ignore
         self.__dict__.update(attributes)
 
     @classmethod
@@ -490,7 +487,11 @@ class Result(ChangeAware):
 
 
 def is_sensitive_schema(defs, key):
-    defSchema = (key in defs and defs[key].schema) or {}
+    return key in defs and _is_sensitive_property(defs[key])
+
+
+def _is_sensitive_property(prop_def):
+    defSchema = prop_def.schema or {}
     defMeta = defSchema.get("metadata", {})
     return defMeta.get("sensitive")
 
@@ -754,6 +755,10 @@ class Results(ABC, metaclass=ProxyableType):
         return self._get(key)
 
     def _get(self, key):
+        val = self._attributes[key]
+        if isinstance(val, ResultsItem) and val.last_computed == MAX_CHANGE_COUNT:
+            # fast path: a concrete value that was already read never needs re-evaluation
+            return val.resolved
         return self._getresult(key).resolved
 
     def _getresult(self, key, validate: Optional[bool] = None) -> ResultsItem:
@@ -790,10 +795,13 @@ class Results(ABC, metaclass=ProxyableType):
 
     def __setitem__(self, key, value) -> None:
         # value is treated as a concrete value, it is never evaluated again
-        if self.validate:
-            self._validate(key, value)
-        if self.defs and is_sensitive_schema(self.defs, key):
-            value = wrap_sensitive_value(value)
+        propDef = self.defs.get(key) if self.defs else None
+        if propDef:
+            # validate once here, not again when comparing with the old value below
+            if self.validate:
+                self._validate(key, value, propDef=propDef)
+            if _is_sensitive_property(propDef):
+                value = wrap_sensitive_value(value)
 
         assert not isinstance(value, Result), value
         if key not in self._attributes:
@@ -802,17 +810,12 @@ class Results(ABC, metaclass=ProxyableType):
             old_val = self._attributes[key]
             if isinstance(old_val, ResultsItem):
                 if old_val.resolved != value:  # only set if values are different
-                    if self.validate:
-                        self._validate(key, value)
                     self.bump_change_count()
                     old_val.update_value(value)
             else:
                 # hasn't been evaluate yet
-                if value != old_val:
-                    # if old_val is computed we don't know if it's unequal without evaluating old_val
-                    # but don't bother with that, the caller can compare the resolved item if they care
-                    if self.validate:
-                        self._validate(key, value)
+                # if old_val is computed we don't know if it's unequal without evaluating old_val
+                # but don't bother with that, the caller can compare the resolved item if they care
                 self._attributes[key] = ResultsItem(
                     value, old_val, MAX_CHANGE_COUNT_SET
                 )
@@ -823,37 +826,37 @@ class Results(ABC, metaclass=ProxyableType):
     def resolve(self, key, val, validate: Optional[bool] = None) -> Result:
         # lazily evaluate lists and dicts
         self.context.trace("Results._mapValue", key, val)
-        defs = self.get_datatype_defs(key)
+        # look up the property definition once instead of in each step below
+        propDef = self.defs.get(key)
+        # if property is not a complex datatype this will be {}
+        defs = propDef.entity.properties if propDef else None
         resolved = self._map_value(val, self.context, self.applyTemplates, defs)
         # will return a Result if it was val was an expression that was evaluated
         if isinstance(resolved, Result):
             result = resolved
         else:
             result = Result(resolved)
-        resolved = result.resolved = self._transform(key, result.resolved)
+        if propDef:
+            resolved = result.resolved = self._transform(key, result.resolved, propDef)
+        else:
+            resolved = result.resolved
         if isinstance(resolved, MutableSequence) and resolved:
             # make sure we don't have a List[Result]
             assert not isinstance(resolved[0], Result), resolved[0]
 
         if self.validate if validate is None else validate:
-            self._validate(key, resolved, val)
-        if self.defs and is_sensitive_schema(self.defs, key):
+            self._validate(key, resolved, val, propDef)
+        if propDef and _is_sensitive_property(propDef):
             result.resolved = wrap_sensitive_value(resolved)
 
         assert not isinstance(result.resolved, Result)
         return result
 
-    def get_datatype_defs(self, key) -> Optional[Dict[str, Any]]:
-        property = self.defs.get(key)
-        if property:
-            # if property is not a complex datatype this will return {}
-            return property.entity.properties
-        return None
-
-    def _transform(self, key, value):
+    def _transform(self, key, value, property: Optional[Property] = None):
         from .eval import map_value
 
-        property = self.defs.get(key)
+        if property is None:
+            property = self.defs.get(key)
         if property:
             transform = self._get_prop_metadata_key(property, "transform")
             if transform:
@@ -213,20 +213,23 @@ class Operational(ChangeAware):
 
     @property
     def last_change(self) -> Optional[str]:
-        if not self.last_state_change:
-            return self.last_config_change
-        elif not self.last_config_change:
-            return self.last_state_change
+        last_state_change = self.last_state_change
+        last_config_change = self.last_config_change
+        if not last_state_change:
+            return last_config_change
+        elif not last_config_change:
+            return last_state_change
         else:
-            return max(self.last_state_change, self.last_config_change)
+            return max(last_state_change, last_config_change)
 
     def has_changed(self, changeset: Optional["ChangeRecord"]) -> bool:
         # if changed since the last time we checked
-        if not self.last_change:
+        last_change = self.last_change
+        if not last_change:
             return False
         if not changeset:
             return True
-        return self.last_change > changeset.changeId
+        return last_change > changeset.changeId
 
     def is_computed(self) -> bool:
         return False
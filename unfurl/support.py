@@ -1724,6 +1724,7 @@ class AttributeManager:
             _attributes = {}
             defs = resource.template and resource.template.propertyDefs or {}
             foundSensitive = []
+            foundChanged = False
             touched: Dict[str, Any] = {}
             # items in overrides of type ResultsItem have been accessed during this transaction
             for key, value in list(overrides.items()):
@@ -1747,8 +1748,10 @@ class AttributeManager:
                         assert not changed  # changed implies isLive
                         continue  # it hasn't changed and it is part of the spec so don't save it as an attribute
 
-                    if changed and is_sensitive:
-                        foundSensitive.append(key)
+                    if changed:
+                        foundChanged = True
+                        if is_sensitive:
+                            foundSensitive.append(key)
                         # XXX if defMeta.get('immutable') and key in specd:
                         #  error('value of attribute "%s" changed but is marked immutable' % key)
 
@@ -1759,6 +1762,9 @@ class AttributeManager:
             if touched:
                 _dependencies[resource.key] = (resource, touched)
             # save changes
+            if not foundChanged and not attributes._deleted:
+                # get_diff() would just re-check the items we already checked above
+                continue
             diff = attributes.get_diff()
             if not diff:
                 continue
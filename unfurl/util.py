@@ -255,6 +255,10 @@ def assert_form(src: Any, types: Any, test: bool = True) -> MutableSequence: ...
 
 
 def assert_form(src: Any, types=Mapping, test: bool = True):
+    # fast path: avoid the slower abc isinstance check for the common cases
+    # (CommentedMap is a dict subclass)
+    if test and (type(src) is types or (types is Mapping and isinstance(src, dict))):
+        return src
     if not isinstance(src, types) or not test:
         raise TypeError(f"Wrong shape: {src} isn't a {types}")
     return src
@@ -313,6 +317,8 @@ def lookup_class(kind: str) -> object:
         return _ClassRegistry[kind]
     elif kind in _shortNameRegistry:
         className = _shortNameRegistry[kind]
+        if className in _ClassRegistry:
+            return _ClassRegistry[className]
     else:
         className = kind
     try:
@@ -535,16 +541,35 @@ def validate_schema(obj: Any, schema: Mapping, baseUri: Optional[str] = None) ->
     return not find_schema_errors(obj, schema)
 
 
+# validators for schemas loaded from a file or the manifest schema, keyed by (cache_key, baseUri)
+_schema_validators: Dict[Tuple[str, Optional[str]], Any] = {}
+
+
 def find_schema_errors(
-    obj: Any, schema: Mapping, baseUri: Optional[str] = None
+    obj: Any,
+    schema: Mapping,
+    baseUri: Optional[str] = None,
+    cache_key: Optional[str] = None,
 ) -> Optional[Tuple[str, List[object]]]:
+    """
+    Validate ``obj`` against ``schema``.
+    If ``cache_key`` is set, the (checked) validator is saved for reuse with that key,
+    only set this if the key (e.g. a file path) always identifies the same schema.
+    """
     # XXX2 have option that includes definitions from manifest's schema
-    if baseUri is not None:
-        resolver = RefResolver(base_uri=baseUri, referrer=schema)
-    else:
-        resolver = None
-    DefaultValidatingLatestDraftValidator.check_schema(schema)
-    validator = DefaultValidatingLatestDraftValidator(schema, resolver=resolver)
+    validator = None
+    if cache_key is not None:
+        validator = _schema_validators.get((cache_key, baseUri))
+    if validator is None:
+        if baseUri is not None:
+            resolver = RefResolver(base_uri=baseUri, referrer=schema)
+        else:
+            resolver = None
+        # checking the schema is much slower than validating a typical document
+        DefaultValidatingLatestDraftValidator.check_schema(schema)
+        validator = DefaultValidatingLatestDraftValidator(schema, resolver=resolver)
+        if cache_key is not None:
+            _schema_validators[(cache_key, baseUri)] = validator
     errors = list(validator.iter_errors(obj))
     error = jsonschema.exceptions.best_match(errors)
     if not error:
@@ -1,7 +1,7 @@
 # Copyright (c) 2020 Adam Souzis
 # SPDX-License-Identifier: MIT
 import fnmatch
-from functools import partial
+from functools import lru_cache, partial
 import io
 import os.path
 from pathlib import Path
@@ -1014,6 +1014,12 @@ class LoadIncludeAction:
         self.check_include = check_include
 
 
+@lru_cache(maxsize=None)
+def _load_schema_file(path: str) -> dict:
+    with open(path) as fp:
+        return json.load(fp)
+
+
 class YamlConfig:
     def __init__(
         self,
@@ -1024,12 +1030,15 @@ class YamlConfig:
         loadHook=None,
         vault=None,
         readonly=False,
+        schema_key: Optional[str] = None,
     ):
         try:
             self._yaml = None
             self.vault = vault
             self.path = None
             self.schema = schema
+            # identifies a shared schema so its validator can be cached
+            self.schema_key = schema_key
             self.readonly = bool(readonly)
             self.file_size = None
             self.saved = False
@@ -1096,6 +1105,7 @@ class YamlConfig:
             self.loadHook,
             self.vault,
             self.readonly,
+            self.schema_key,
         )
 
     def _expand(self) -> Tuple[Mapping, Mapping]:
@@ -1193,14 +1203,14 @@ class YamlConfig:
         if isinstance(self.schema, str):
             # assume its a file path
             path = self.schema
-            with open(path) as fp:
-                self.schema = json.load(fp)
+            self.schema = _load_schema_file(path)
+            self.schema_key = path
         else:
             path = None
         baseUri = None
         if path:
             baseUri = urljoin("file:", urllib.request.pathname2url(path))
-        return find_schema_errors(config, self.schema, baseUri)
+        return find_schema_errors(config, self.schema, baseUri, self.schema_key)
 
     def search_includes(
         self, key: Optional[str] = None, pathPrefix: Optional[str] = None
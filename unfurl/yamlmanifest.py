@@ -21,7 +21,6 @@ from collections.abc import MutableSequence, Mapping
 import numbers
 import os
 import os.path
-import itertools
 
 try:
     # added in python 3.9
@@ -260,9 +259,8 @@ class ReadOnlyManifest(Manifest):
         self._importedManifests: Dict[int, Optional["YamlManifest"]] = {}
         readonly = bool(localEnv and localEnv.readonly)
         self.safe_mode = bool(safe_mode)
-        schema = get_manifest_schema(
-            localEnv and localEnv.overrides.get("format") or ""
-        )
+        schema_format = localEnv and localEnv.overrides.get("format") or ""
+        schema = get_manifest_schema(schema_format)
         self.manifest = YamlConfig(
             manifest,
             self.path,
@@ -271,6 +269,7 @@ class ReadOnlyManifest(Manifest):
             self.load_yaml_include,
             vault,
             readonly,
+            schema_key="manifest-schema:" + schema_format,
         )
         if self.manifest.path:
             logger.debug("loaded ensemble manifest at %s", self.manifest.path)
@@ -376,8 +375,20 @@ def _match_deployment_blueprints(deployment_blueprints, context):
     return None
 
 
+def _read_change_log_lines(f, size: int) -> Iterable[str]:
+    # yield the decoded lines in the first size bytes of binary file f
+    read = 0
+    for line in f:
+        if read >= size:
+            break
+        line = line[: size - read]
+        read += len(line)
+        yield line.decode().strip()
+
+
 class YamlManifest(ReadOnlyManifest):
     _operationIndex: Optional[Dict[Tuple[str, str], str]] = None
+    _pendingChangeLog: Optional[Tuple[str, int]] = None
     lockfilepath = None
     lockfile = None
     lfs_locked: Optional[str] = None
@@ -719,20 +730,39 @@ class YamlManifest(ReadOnlyManifest):
                 c.changeId: c
                 for c in (self.load_config_change(changeSet) for changeSet in changes)
             }
+            return True
         elif changeLogPath:
             fullLogPath = self.get_change_log_path()
             if os.path.isfile(fullLogPath):
-                with open(fullLogPath) as f:
-                    self.changeSets = {
-                        c.changeId: c
-                        for c in (
-                            ChangeRecordRecord(parse=line.strip())
-                            for line in f.readlines()
-                            if not line.strip().startswith("#")
-                        )
-                        if not hasattr(c, "startCommit")  # not a job record
-                    }
-        return self.changeSets is not None
+                # the change log grows with every job so defer parsing it until it is needed
+                # but snapshot its length now so records appended after loading aren't included
+                with open(fullLogPath, "rb") as f:
+                    size = os.fstat(f.fileno()).st_size
+                self._pendingChangeLog = (fullLogPath, size)
+                return True
+        return False
+
+    def _load_change_sets(self) -> Optional[Dict[str, ChangeRecordRecord]]:
+        if not self._pendingChangeLog:
+            return None
+        fullLogPath, size = self._pendingChangeLog
+        self._pendingChangeLog = None
+        try:
+            with open(fullLogPath, "rb") as f:
+                # stream the log up to the size it had when the ensemble was loaded
+                return {
+                    c.changeId: c
+                    for c in (
+                        ChangeRecordRecord(parse=line)
+                        for line in _read_change_log_lines(f, size)
+                        if not line.startswith("#")
+                    )
+                    if not hasattr(c, "startCommit")  # not a job record
+                }
+        except (OSError, UnicodeDecodeError) as e:
+            raise UnfurlError(
+                f'Could not read change log "{fullLogPath}" after loading the ensemble: {e}'
+            )
 
     def lfs_settings(self) -> Tuple[bool, bool, str, Optional[str]]:
         local = self.manifest.expanded.get("environment", {}).get("lfs_lock")
@@ -839,13 +869,13 @@ class YamlManifest(ReadOnlyManifest):
         if self._operationIndex is None:
             operationIndex: Dict[Tuple[str, str], str] = {}
             if self.changeSets:
-                # add list() for 3.7
-                for change in reversed(list(self.changeSets.values())):
+                # single pass keeping the highest changeId seen for each (target, operation)
+                for change in self.changeSets.values():
                     if not change.target or not change.operation:
                         continue
                     key = (change.target, change.operation)
-                    last = operationIndex.setdefault(key, change.changeId)
-                    if last < change.changeId:
+                    last = operationIndex.get(key)
+                    if last is None or last < change.changeId:
                         operationIndex[key] = change.changeId
             self._operationIndex = operationIndex
         changeId = self._operationIndex.get((target, operation))
@@ -1234,8 +1264,7 @@ class YamlManifest(ReadOnlyManifest):
                 changelog["manifest"] = os.path.relpath(
                     self.manifest.path, os.path.dirname(fullPath)
                 )
-            changes = itertools.chain([jobRecord], newChanges)
-            changelog["changes"] = list(changes)
+            changelog["changes"] = [jobRecord, *newChanges]
             output = io.StringIO()
             self.yaml.dump(changelog, output)
             if not os.path.isdir(os.path.dirname(fullPath)):